@@ -19,12 +19,16 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=str(Path(__file__).resolve().parents[1] / ".env"),
         case_sensitive=False,
+        frozen=True,
     )
 
     debug: bool = Field(default=False, validation_alias="DEBUG")
     cache_dir: Path = Field(default=DEFAULT_CACHE_DIR, validation_alias="CACHE_DIR")
     cache_ttl_seconds: int = Field(default=21600, validation_alias="CACHE_TTL_SECONDS")
     verify_ssl: bool = Field(default=True, validation_alias="VERIFY_SSL")
+    # The channel cache is rebuildable from the provider, so rename atomicity
+    # is enough by default; enable to fsync each file before it is swapped in.
+    cache_durable_fsync: bool = Field(default=False, validation_alias="CACHE_DURABLE_FSYNC")
     credentials_file: Path = Field(
         default=DEFAULT_CREDENTIALS_FILE,
         validation_alias="CREDENTIALS_FILE",
@@ -6,13 +6,15 @@ from contextlib import asynccontextmanager
 import logging
 import time
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from backend.app.config import get_settings
 from backend.app.routes.channels import router as channels_router
-from backend.app.services import accounts, auth
-from backend.app.utils.logging import configure_logging
+from backend.app.services import accounts, auth, cache
+from backend.app.utils.logging import configure_logging, stop_logging
 
 LOGGER = logging.getLogger(__name__)
 
@@ -22,7 +24,7 @@ async def lifespan(app: FastAPI):
     """Configure logging and log registered routes."""
 
     settings = get_settings()
-    configure_logging(settings.debug)
+    app.state.log_listener = configure_logging(settings.debug)
     LOGGER.debug("Application startup.")
     LOGGER.info(
         "Config summary debug=%s cache_dir=%s cache_ttl_seconds=%s verify_ssl=%s credentials_file=%s",
@@ -42,20 +44,24 @@ async def lifespan(app: FastAPI):
             )
     except Exception:
         LOGGER.exception("[ACCOUNT] Error while loading saved credentials")
-    for route in app.router.routes:
-        methods = getattr(route, "methods", None)
-        methods_str = ",".join(sorted(methods)) if methods else "N/A"
-        endpoint = getattr(route.endpoint, "__module__", None)
-        LOGGER.info(
-            "Registered route: %s %s name=%s endpoint=%s",
-            methods_str,
-            route.path,
-            route.name,
-            endpoint,
-        )
+    # Cache-backed routes run on the event loop, so parse the cache file here
+    # rather than on the first request.
+    cache.load_cache()
+    if LOGGER.isEnabledFor(logging.INFO):
+        lines = [
+            "  {} {} name={} endpoint={}".format(
+                ",".join(sorted(route.methods)) if getattr(route, "methods", None) else "N/A",
+                route.path,
+                route.name,
+                getattr(route.endpoint, "__module__", None),
+            )
+            for route in app.router.routes
+        ]
+        LOGGER.info("Registered routes:\n%s", "\n".join(lines))
     yield
 
     LOGGER.info("Application shutdown")
+    stop_logging(app.state.log_listener)
 
 
 # -----------------------------------------------------------------------------
@@ -66,24 +72,13 @@ app = FastAPI(
     title="IPTV Backend",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # -----------------------------------------------------------------------------
 # CORS (required for UI / browser)
 # -----------------------------------------------------------------------------
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # dev only
-    allow_credentials=True,
-    allow_methods=["*"],  # includes OPTIONS
-    allow_headers=["*"],
-)
-
-# -----------------------------------------------------------------------------
-# Routers
-# -----------------------------------------------------------------------------
-
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -95,46 +90,66 @@ app.add_middleware(
         "http://127.0.0.1:8501",
     ],
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=["*"],  # includes OPTIONS
     allow_headers=["*"],
 )
 
+# -----------------------------------------------------------------------------
+# Routers
+# -----------------------------------------------------------------------------
+
 app.include_router(channels_router)
 
 # -----------------------------------------------------------------------------
 # HTTP logging middleware (debug only)
 # -----------------------------------------------------------------------------
 
-@app.middleware("http")
-async def log_routes(request: Request, call_next):
+class DebugLoggingMiddleware:
     """
     Log route entry/exit when debug is enabled.
-    """
-
-    settings = get_settings()
-    if not settings.debug:
-        return await call_next(request)
 
-    LOGGER.debug("-> %s %s", request.method, request.url.path)
-    start_time = time.monotonic()
-
-    response = await call_next(request)
-
-    duration_ms = (time.monotonic() - start_time) * 1000
-    LOGGER.debug(
-        "<- %s %s status=%s duration_ms=%.2f",
-        request.method,
-        request.url.path,
-        response.status_code,
-        duration_ms,
-    )
-    return response
+    Plain ASGI middleware: when disabled it forwards the call untouched, with
+    no ``Request`` object or extra coroutine frame per request.
+    """
 
+    def __init__(self, app: ASGIApp, enabled: bool) -> None:
+        self.app = app
+        self.enabled = enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            not self.enabled
+            or scope["type"] != "http"
+            or not LOGGER.isEnabledFor(logging.DEBUG)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = scope["path"]
+        status_code: int | None = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        LOGGER.debug("-> %s %s", method, path)
+        start_time = time.monotonic()
+
+        await self.app(scope, receive, send_wrapper)
+
+        duration_ms = (time.monotonic() - start_time) * 1000
+        LOGGER.debug(
+            "<- %s %s status=%s duration_ms=%.2f",
+            method,
+            path,
+            status_code,
+            duration_ms,
+        )
 
-# -----------------------------------------------------------------------------
-# Health check (useful for debug, Docker, Roku, etc.)
-# -----------------------------------------------------------------------------
 
-@app.get("/health")
-def health():
-    return {"status": "ok"}
+# The middleware stack is built before lifespan runs, so the debug flag is
+# read from the (cached, immutable) settings at registration time.
+app.add_middleware(DebugLoggingMiddleware, enabled=get_settings().debug)
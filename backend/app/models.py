@@ -1,6 +1,6 @@
 """Pydantic models for request and response validation."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CredentialsIn(BaseModel):
@@ -11,7 +11,13 @@ class CredentialsIn(BaseModel):
     password: str = Field(..., min_length=1)
 
 
-class Channel(BaseModel):
+class _ResponseModel(BaseModel):
+    """Base for response payloads: fixed field set, immutable once built."""
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+
+class Channel(_ResponseModel):
     """Normalized channel data returned to clients."""
 
     name: str
@@ -22,7 +28,7 @@ class Channel(BaseModel):
     tvg_chno: str | None = None
 
 
-class ChannelListResponse(BaseModel):
+class ChannelListResponse(_ResponseModel):
     """Response wrapper for channel lists."""
 
     channels: list[Channel]
@@ -32,7 +38,7 @@ class ChannelListResponse(BaseModel):
     cached: bool = False
 
 
-class StatusResponse(BaseModel):
+class StatusResponse(_ResponseModel):
     """Service status payload."""
 
     logged_in: bool
@@ -50,7 +56,7 @@ class StatusResponse(BaseModel):
     last_successful_refresh: str | None = None
 
 
-class StatsResponse(BaseModel):
+class StatsResponse(_ResponseModel):
     """Aggregate channel counts by category."""
 
     total: int
@@ -60,7 +66,7 @@ class StatsResponse(BaseModel):
     other: int
 
 
-class ContentItem(BaseModel):
+class ContentItem(_ResponseModel):
     """Content item formatted for Roku UI rows."""
 
     id: str
@@ -74,14 +80,14 @@ class ContentItem(BaseModel):
     rating: str | None = None
 
 
-class ContentRow(BaseModel):
+class ContentRow(_ResponseModel):
     """Row of content items."""
 
     title: str
     items: list[ContentItem]
 
 
-class ContentRowsResponse(BaseModel):
+class ContentRowsResponse(_ResponseModel):
     """Response wrapper for content rows."""
 
     category: str
@@ -11,20 +11,22 @@ Endpoints:
 - GET    /health
 """
 
-import json
+import asyncio
 import logging
 import os
 import sys
-import threading
 import time
 import uuid
 from datetime import datetime, timezone
-from typing import Iterable
+from functools import lru_cache
+from itertools import islice
 from urllib.parse import urlparse
 
+import orjson
+
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Request
-from fastapi.responses import JSONResponse
-import requests
+from fastapi.responses import ORJSONResponse, Response
+from starlette.concurrency import run_in_threadpool
 
 from backend.app.config import get_settings
 from backend.app.models import (
@@ -39,7 +41,13 @@ from backend.app.services import roku_content
 
 LOGGER = logging.getLogger(__name__)
 
-router = APIRouter(tags=["channels"])
+router = APIRouter(tags=["channels"], default_response_class=ORJSONResponse)
+
+# Settings are cached and immutable, so the debug gate is resolved once at import
+# (as for the debug logging middleware) instead of on every debug request.
+_DEBUG_ENABLED: bool = get_settings().debug
+
+MAX_PAGE_SIZE = 100
 
 
 # ============================================================================
@@ -75,8 +83,8 @@ def save_account(credentials: CredentialsIn) -> dict[str, str]:
 def get_account() -> dict[str, str | bool | None]:
     """Return account status and configured host (without password)."""
     active = auth.get_credentials()
-    stored = accounts.load_credentials()
-    host = (active or stored).host if (active or stored) else None
+    credentials = active or accounts.load_credentials()
+    host = credentials.host if credentials else None
     return {
         "connected": active is not None,
         "host": host,
@@ -95,22 +103,150 @@ def delete_account() -> dict[str, str]:
 # CHANNELS
 # ============================================================================
 
-@router.get("/channels", response_model=ChannelListResponse)
-def get_channels(
+@lru_cache(maxsize=256)
+def _norm_filters(
+    search: str | None,
+    category: str | None,
+    group: str | None,
+) -> tuple[str | None, str | None, str | None]:
+    """Lowercase /channels filter values (memoized for repeated UI polls)."""
+    return (
+        search.lower() if search else None,
+        category.lower() if category else None,
+        group.lower() if group else None,
+    )
+
+
+def _public_channel(ch: dict) -> dict:
+    """Project a cached channel onto the ``Channel`` response shape."""
+    return {
+        "name": ch["name"],
+        "group": ch["group"],
+        "category": ch["category"],
+        "url": ch["url"],
+        "tvg_logo": ch.get("tvg_logo"),
+        "tvg_chno": ch.get("tvg_chno"),
+    }
+
+
+def _channel_json(ch: dict) -> bytes:
+    """Return the encoded ``Channel`` for a cached channel.
+
+    The bytes are memoized on the cached dict under the runtime-only
+    ``_json`` key, so each channel is projected and encoded at most once per
+    loaded payload.
+    """
+    body = ch.get("_json")
+    if body is None:
+        body = orjson.dumps(_public_channel(ch))
+        ch["_json"] = body
+    return body
+
+
+def _channel_page(
+    items: list[dict],
+    *,
+    cached: bool,
+    total: int,
+    page: int,
+    page_size: int,
+) -> Response:
+    """Splice a ``ChannelListResponse`` body from pre-encoded channel rows."""
+    # Pages are bounded by MAX_PAGE_SIZE, so the body is assembled in one go
+    # rather than streamed; it stays a few KB.
+    tail = orjson.dumps(
+        {"total": total, "page": page, "page_size": page_size, "cached": cached}
+    )
+    body = b"".join(
+        (
+            b'{"channels":[',
+            b",".join([_channel_json(ch) for ch in items]),
+            b"],",
+            tail[1:],
+        )
+    )
+    return Response(content=body, media_type="application/json")
+
+
+def _intersect(offsets: list[int] | None, other: list[int]) -> list[int]:
+    """Intersect two ascending offset lists, keeping ascending order."""
+    if offsets is None:
+        return other
+    smaller, larger = sorted((offsets, other), key=len)
+    larger_set = set(larger)
+    return [i for i in smaller if i in larger_set]
+
+
+def _match_offsets(
+    cached: dict,
+    search_l: str,
+    category_l: str,
+    group_l: str,
+    limit: int | None,
+) -> list[int]:
+    """Return ascending offsets of the channels matching every filter.
+
+    With ``limit`` set the search scan stops after that many matches.
+    """
+    # Narrow the scan with the offset indexes built by the cache layer. Group
+    # filters are substring matches over the group keys. Offsets taken from
+    # the group and category indexes already satisfy those filters, so only
+    # the search is checked below.
+    candidates: list[int] | None = None
+    if group_l:
+        candidates = cache.group_candidates(cached, group_l)
+    if category_l:
+        candidates = _intersect(candidates, cached["by_category"].get(category_l, []))
+    if not search_l:
+        return candidates if candidates is not None else []
+
+    # Searches are narrowed with the in-memory name indexes; the substring
+    # check below still verifies every candidate.
+    found = cache.search_candidates(cached, search_l)
+    if found is not None:
+        candidates = _intersect(candidates, found)
+
+    # Only the search is left to verify; scan the lowercase name column
+    # rather than the channel dicts.
+    names = cache.name_column(cached)
+    if candidates is None:
+        hits = (i for i, name in enumerate(names) if search_l in name)
+    else:
+        hits = (i for i in candidates if search_l in names[i])
+    return list(hits) if limit is None else list(islice(hits, limit))
+
+
+async def _cache_payload() -> dict | None:
+    """Return the cache payload, parsing the file off the event loop.
+
+    The memoized payload is returned inline; a miss (first load, or the file
+    was replaced by another worker or by hand) runs ``load_cache`` in the
+    threadpool so other requests keep being served meanwhile.
+    """
+    cached = cache.memoized_cache()
+    if cached is None:
+        cached = await run_in_threadpool(cache.load_cache)
+    return cached
+
+
+@router.get("/channels", responses={200: {"model": ChannelListResponse}})
+async def get_channels(
     page: int = Query(1, ge=1),
-    page_size: int = Query(50, ge=1, le=100),
+    page_size: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
     search: str | None = Query(None, min_length=1),
     category: str | None = Query(None, min_length=1),
     group: str | None = Query(None, min_length=1),
-) -> ChannelListResponse:
+    include_total: bool = Query(True),
+) -> Response:
     """
     Return paginated channels from cache.
 
     Filtering is applied BEFORE pagination.
-    Streaming-safe: no full list slicing.
+    Unfiltered pages are sliced directly; filtered scans stop once the page
+    is full when ``include_total`` is false (``total`` is then a lower bound).
     """
 
-    LOGGER.info(
+    LOGGER.debug(
         "Channels request page=%s page_size=%s search=%s category=%s group=%s",
         page,
         page_size,
@@ -118,58 +254,66 @@ def get_channels(
         category,
         group,
     )
-    cached = cache.load_cache()
+    cached = await _cache_payload()
     if not cached:
         LOGGER.info("Channels requested but cache is missing")
-        return ChannelListResponse(
-            channels=[],
+        return _channel_page(
+            [],
             cached=False,
             total=0,
             page=page,
             page_size=page_size,
         )
 
-    channels: Iterable[dict] = cached.get("channels", [])
+    channels: list[dict] = cached.get("channels", [])
 
-    search_l = search.lower() if search else None
-    category_l = category.lower() if category else None
-    group_l = group.lower() if group else None
+    search_l, category_l, group_l = _norm_filters(search, category, group)
     if category_l and category_l not in iptv.ALLOWED_CATEGORIES:
         LOGGER.info("Invalid category filter provided: %s", category)
-        return ChannelListResponse(
-            channels=[],
+        return _channel_page(
+            [],
             cached=True,
             total=0,
             page=page,
             page_size=page_size,
         )
 
-    def matches(ch: dict) -> bool:
-        if search_l and search_l not in ch.get("name", "").lower():
-            return False
-        if category_l and ch.get("category", "other").lower() != category_l:
-            return False
-        if group_l and group_l not in ch.get("group", "").lower():
-            return False
-        return True
-
     offset = (page - 1) * page_size
-    items: list[dict] = []
-    total = 0
+    end = offset + page_size
 
-    for ch in channels:
-        if not matches(ch):
-            continue
-
-        if offset <= total < offset + page_size:
-            items.append(ch)
+    if not (search_l or category_l or group_l):
+        return _channel_page(
+            channels[offset:end],
+            cached=True,
+            total=len(channels),
+            page=page,
+            page_size=page_size,
+        )
 
-        total += 1
+    # Plain category or (already merged) group filters are a lookup in the
+    # cache layer's offset indexes and are answered inline. Everything else
+    # walks O(N) offsets or names at least once, so it runs in the threadpool
+    # to keep /health and other requests responsive meanwhile.
+    candidates: list[int] | None = None
+    if not search_l:
+        if category_l and not group_l:
+            candidates = cached["by_category"].get(category_l, [])
+        elif group_l and not category_l and cache.group_ready(cached, group_l):
+            candidates = cache.group_candidates(cached, group_l)
+    if candidates is None:
+        candidates = await run_in_threadpool(
+            _match_offsets,
+            cached,
+            search_l,
+            category_l,
+            group_l,
+            None if include_total else end,
+        )
 
-    return ChannelListResponse(
-        channels=items,
+    return _channel_page(
+        [channels[i] for i in candidates[offset:end]],
         cached=True,
-        total=total,
+        total=len(candidates),
         page=page,
         page_size=page_size,
     )
@@ -187,15 +331,6 @@ def _refresh_job(credentials: CredentialsIn, request_id: str) -> None:
         credentials.host,
     )
 
-    stop_heartbeat = threading.Event()
-    def heartbeat_loop() -> None:
-        while not stop_heartbeat.is_set():
-            cache.set_refresh_heartbeat_at()
-            stop_heartbeat.wait(5)
-
-    heartbeat_thread = threading.Thread(target=heartbeat_loop, daemon=True)
-    heartbeat_thread.start()
-
     try:
         cache.set_refresh_heartbeat_at()
         LOGGER.info(
@@ -203,9 +338,13 @@ def _refresh_job(credentials: CredentialsIn, request_id: str) -> None:
             request_id,
             credentials.host,
         )
-        playlist = iptv.fetch_m3u(credentials, request_id=request_id)
-        cache.set_refresh_heartbeat_at()
-        channels = iptv.parse_m3u(playlist, request_id=request_id)
+        # The heartbeat advances as the download makes progress, so a stalled
+        # provider shows up as a stale heartbeat on /status.
+        channels = iptv.fetch_m3u(
+            credentials,
+            request_id=request_id,
+            on_progress=cache.set_refresh_heartbeat_at,
+        )
         cache.set_refresh_heartbeat_at()
 
         LOGGER.info(
@@ -225,7 +364,6 @@ def _refresh_job(credentials: CredentialsIn, request_id: str) -> None:
         )
 
     finally:
-        stop_heartbeat.set()
         cache.set_refreshing(False)
         LOGGER.info(
             "[REFRESH] Background refresh finished request_id=%s",
@@ -240,7 +378,10 @@ def refresh_channels(background_tasks: BackgroundTasks, request: Request) -> dic
     client_host = request.client.host if request.client else "unknown"
     LOGGER.info("[REFRESH] Refresh requested client=%s", client_host)
 
-    if not auth.has_credentials():
+    # Read the credentials once; the job keeps this snapshot even if the
+    # account is replaced or deleted while it runs.
+    credentials = auth.get_credentials()
+    if credentials is None:
         LOGGER.info("[REFRESH] Refresh requested without active account")
         raise HTTPException(409, "not logged in")
 
@@ -253,12 +394,6 @@ def refresh_channels(background_tasks: BackgroundTasks, request: Request) -> dic
             "refresh_heartbeat_at": cache.get_refresh_heartbeat_at(),
         }
 
-    credentials = auth.get_credentials()
-    if credentials is None:
-        cache.set_refreshing(False)
-        LOGGER.info("[REFRESH] Refresh requested but credentials missing in memory")
-        raise HTTPException(409, "not logged in")
-
     request_id = str(uuid.uuid4())
     LOGGER.info(
         "[REFRESH] Using stored credentials request_id=%s host=%s timeout=20s",
@@ -278,36 +413,32 @@ def refresh_channels(background_tasks: BackgroundTasks, request: Request) -> dic
 # STATUS / STATS
 # ============================================================================
 
-@router.get("/status", response_model=StatusResponse)
-def status() -> StatusResponse:
+@router.get("/status", responses={200: {"model": StatusResponse}})
+async def status() -> ORJSONResponse:
     """Return backend and cache status."""
 
-    cached = cache.load_cache()
-    refresh_metadata = cache.get_refresh_metadata(cached)
-    refresh_started_at = cache.get_refresh_started_at()
-    refresh_heartbeat_at = cache.get_refresh_heartbeat_at()
+    cached = cache.load_summary(parse=False)
+    if cached is None:
+        cached = await run_in_threadpool(cache.load_summary)
+    refresh_metadata = cache.get_refresh_snapshot(cached)
+    refresh_started_at = refresh_metadata["refresh_started_at"]
+    refresh_heartbeat_at = refresh_metadata["refresh_heartbeat_at"]
+    refreshing = refresh_metadata["refreshing"]
     refresh_elapsed_seconds = None
     refresh_heartbeat_age_seconds = None
     refresh_state = "idle"
 
-    if refresh_started_at:
-        try:
-            started = datetime.fromisoformat(refresh_started_at)
-            now = datetime.now(timezone.utc)
-            refresh_elapsed_seconds = max(0, int((now - started).total_seconds()))
-        except Exception:
-            refresh_elapsed_seconds = None
-    if refresh_heartbeat_at:
-        try:
-            heartbeat = datetime.fromisoformat(refresh_heartbeat_at)
-            now = datetime.now(timezone.utc)
-            refresh_heartbeat_age_seconds = max(0, int((now - heartbeat).total_seconds()))
-        except Exception:
-            refresh_heartbeat_age_seconds = None
+    now = time.time()
+    started_ts = refresh_metadata["refresh_started_ts"]
+    heartbeat_ts = refresh_metadata["refresh_heartbeat_ts"]
+    if started_ts is not None:
+        refresh_elapsed_seconds = max(0, int(now - started_ts))
+    if heartbeat_ts is not None:
+        refresh_heartbeat_age_seconds = max(0, int(now - heartbeat_ts))
 
     if refresh_metadata["refresh_status"] == "failed":
         refresh_state = "failed"
-    elif cache.is_refreshing():
+    elif refreshing:
         if refresh_heartbeat_age_seconds is not None and refresh_heartbeat_age_seconds > 15:
             refresh_state = "stuck"
         elif refresh_elapsed_seconds is None or refresh_elapsed_seconds < 2:
@@ -317,26 +448,32 @@ def status() -> StatusResponse:
     else:
         refresh_state = "idle"
 
-    return StatusResponse(
-        logged_in=auth.has_credentials(),
-        refreshing=cache.is_refreshing(),
-        cache_available=cached is not None,
-        last_refresh=cached.get("timestamp") if cached else None,
-        channel_count=cached.get("channel_count", 0) if cached else 0,
-        refresh_started_at=refresh_started_at,
-        refresh_elapsed_seconds=refresh_elapsed_seconds,
-        refresh_heartbeat_at=refresh_heartbeat_at,
-        refresh_heartbeat_age_seconds=refresh_heartbeat_age_seconds,
-        refresh_state=refresh_state,
-        refresh_status=refresh_metadata["refresh_status"],
-        last_error=refresh_metadata["last_error"],
-        last_successful_refresh=refresh_metadata["last_successful_refresh"],
+    return ORJSONResponse(
+        {
+            "logged_in": auth.has_credentials(),
+            "refreshing": refreshing,
+            "cache_available": cached is not None,
+            "last_refresh": cached.get("timestamp") if cached else None,
+            "channel_count": cached.get("channel_count", 0) if cached else 0,
+            "refresh_started_at": refresh_started_at,
+            "refresh_elapsed_seconds": refresh_elapsed_seconds,
+            "refresh_heartbeat_at": refresh_heartbeat_at,
+            "refresh_heartbeat_age_seconds": refresh_heartbeat_age_seconds,
+            "refresh_state": refresh_state,
+            "refresh_status": refresh_metadata["refresh_status"],
+            "last_error": refresh_metadata["last_error"],
+            "last_successful_refresh": refresh_metadata["last_successful_refresh"],
+        }
     )
 
 
+# Keys/preview of the cache file from the last /debug/cache read, keyed on
+# (st_mtime_ns, st_size) so repeat hits skip reading the file again.
+_DEBUG_FILE_INFO: tuple[tuple[int, int], list[str] | None, str | None] | None = None
+
+
 def _require_debug() -> None:
-    settings = get_settings()
-    if not settings.debug:
+    if not _DEBUG_ENABLED:
         raise HTTPException(404, "Not found")
 
 
@@ -344,25 +481,34 @@ def _require_debug() -> None:
 def debug_cache(request: Request) -> dict:
     _require_debug()
     cache_path = cache.get_cache_path().resolve()
-    exists = cache_path.exists()
-    size_bytes = cache_path.stat().st_size if exists else None
+    try:
+        stat = cache_path.stat()
+    except OSError:
+        stat = None
+    exists = stat is not None
+    size_bytes = stat.st_size if stat else None
     mtime = (
-        datetime.fromtimestamp(cache_path.stat().st_mtime, tz=timezone.utc).isoformat()
-        if exists
+        datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc).isoformat()
+        if stat
         else None
     )
     
+    global _DEBUG_FILE_INFO
     preview = None
     keys = None
-    if exists:
+    file_key = (stat.st_mtime_ns, stat.st_size) if stat else None
+    info = _DEBUG_FILE_INFO
+    if file_key is not None and info is not None and info[0] == file_key:
+        keys, preview = info[1], info[2]
+    elif exists:
         try:
             if size_bytes is not None and size_bytes <= 1_000_000:
-                with cache_path.open("r", encoding="utf-8") as fh:
-                    payload = json.load(fh)
+                payload = orjson.loads(cache_path.read_bytes())
                 keys = sorted(payload.keys())
             else:
                 with cache_path.open("rb") as fh:
                     preview = fh.read(2048).decode("utf-8", errors="replace")
+            _DEBUG_FILE_INFO = (file_key, keys, preview)
         except Exception:
             LOGGER.exception("Failed to read cache file for debug.")
 
@@ -396,24 +542,61 @@ def debug_cache(request: Request) -> dict:
 
 
 @router.get("/debug/routes")
-def debug_routes(request: Request) -> dict:
+async def debug_routes(request: Request) -> Response:
     _require_debug()
-    routes = []
-    for route in request.app.router.routes:
-        methods = getattr(route, "methods", None)
-        routes.append(
-            {
-                "path": route.path,
-                "methods": sorted(methods) if methods else None,
-                "name": route.name,
-                "endpoint": getattr(route.endpoint, "__module__", None),
-            }
-        )
-    return {"routes": routes}
+    # Routes are fixed once the app is serving, so the table is encoded on the
+    # first call and reused from app state.
+    state = request.app.state
+    body = getattr(state, "debug_routes_body", None)
+    if body is None:
+        routes = []
+        for route in request.app.router.routes:
+            methods = getattr(route, "methods", None)
+            routes.append(
+                {
+                    "path": route.path,
+                    "methods": sorted(methods) if methods else None,
+                    "name": route.name,
+                    "endpoint": getattr(route.endpoint, "__module__", None),
+                }
+            )
+        body = orjson.dumps({"routes": routes})
+        state.debug_routes_body = body
+    return Response(content=body, media_type="application/json")
+
+
+_SELFTEST_DNS_TIMEOUT_SECONDS = 5
+
+
+def _selftest_http_probe(url: str) -> tuple[int, str | None, Exception | None]:
+    """GET the playlist URL and read the first KB.
+
+    Returns the status, Content-Length and any error raised while reading the
+    body; errors before a response is received propagate.
+    """
+    response = iptv.http_session().get(
+        url,
+        headers=iptv.HEADERS,
+        timeout=(5, 10),
+        verify=get_settings().verify_ssl,
+        stream=True,
+        allow_redirects=True,
+    )
+    read_error = None
+    try:
+        next(response.iter_content(chunk_size=1024), None)
+    except Exception as exc:
+        read_error = exc
+    finally:
+        try:
+            response.close()
+        except Exception:
+            pass
+    return response.status_code, response.headers.get("Content-Length"), read_error
 
 
 @router.post("/debug/selftest")
-def debug_selftest() -> dict:
+async def debug_selftest() -> dict:
     _require_debug()
     credentials = auth.get_credentials()
     if credentials is None:
@@ -425,38 +608,40 @@ def debug_selftest() -> dict:
     http_status = None
     content_length = None
     error = None
-    try:
-        import socket
 
+    async def dns_probe() -> None:
         parsed = urlparse(url)
-        host = parsed.netloc or parsed.path.split("/")[0]
-        socket.getaddrinfo(host, None)
+        host = parsed.hostname or parsed.path.split("/")[0]
+        # getaddrinfo runs in the default executor with only the system
+        # resolver's timeouts; bound it like the HTTP connect timeout.
+        try:
+            await asyncio.wait_for(
+                asyncio.get_running_loop().getaddrinfo(host, None),
+                timeout=_SELFTEST_DNS_TIMEOUT_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"timed out after {_SELFTEST_DNS_TIMEOUT_SECONDS}s"
+            ) from None
+
+    # DNS and HTTP probes are independent, so run them side by side; the HTTP
+    # probe uses the blocking requests client on a worker thread.
+    dns_result, http_result = await asyncio.gather(
+        dns_probe(),
+        asyncio.to_thread(_selftest_http_probe, url),
+        return_exceptions=True,
+    )
+    if isinstance(dns_result, BaseException):
+        error = f"dns_error: {dns_result}"
+    else:
         dns_ok = True
-    except Exception as exc:
-        error = f"dns_error: {exc}"
-
-    response = None
-    try:
-        response = requests.get(
-            url,
-            headers=iptv.HEADERS,
-            timeout=(5, 10),
-            verify=get_settings().verify_ssl,
-            stream=True,
-            allow_redirects=True,
-        )
+    if isinstance(http_result, BaseException):
+        error = f"request_error: {http_result}"
+    else:
         tcp_ok = True
-        http_status = response.status_code
-        content_length = response.headers.get("Content-Length")
-        next(response.iter_content(chunk_size=1024), None)
-    except Exception as exc:
-        error = f"request_error: {exc}"
-    finally:
-        if response is not None:
-            try:
-                response.close()
-            except Exception:
-                pass
+        http_status, content_length, read_error = http_result
+        if read_error is not None:
+            error = f"request_error: {read_error}"
 
     return {
         "dns_ok": dns_ok,
@@ -468,38 +653,25 @@ def debug_selftest() -> dict:
     }
 
 
-@router.get("/stats", response_model=StatsResponse)
-def stats() -> StatsResponse:
+@router.get("/stats", responses={200: {"model": StatsResponse}})
+async def stats() -> Response:
     """Return aggregated channel statistics."""
 
-    cached = cache.load_cache()
-    stats = cache.get_stats(cached)
+    cached = await _cache_payload()
     if not cached:
         LOGGER.info("Stats requested but cache is missing")
-    LOGGER.info("Computed stats: %s", stats)
-    counts = stats
-    return StatsResponse(
-        total=counts["total"],
-        tv=counts["tv"],
-        movies=counts["movies"],
-        series=counts["series"],
-        other=counts["other"],
-    )
+    LOGGER.debug("Computed stats: %s", cache.get_stats(cached))
+    return Response(content=cache.stats_body(cached), media_type="application/json")
 
 
 @router.get("/groups")
-def groups() -> dict:
+async def groups() -> Response:
     """Return categories and most common group titles."""
 
-    cached = cache.load_cache()
+    cached = await _cache_payload()
     if not cached:
         LOGGER.info("Groups requested but cache is missing")
-        return {"categories": [], "groups": {}}
-
-    return {
-        "categories": cached.get("categories", []),
-        "groups": cached.get("group_counts", {}),
-    }
+    return Response(content=cache.groups_body(cached), media_type="application/json")
 
 
 # ============================================================================
@@ -507,17 +679,14 @@ def groups() -> dict:
 # ============================================================================
 
 
-@router.get("/roku/content", response_model=ContentRowsResponse)
-def roku_content_rows(category: str = Query("tv", min_length=1)) -> ContentRowsResponse:
+@router.get("/roku/content", responses={200: {"model": ContentRowsResponse}})
+def roku_content_rows(category: str = Query("tv", min_length=1)) -> Response:
     """Return Roku-ready content rows for a given category."""
 
     cached = cache.load_cache()
-    channels = cached.get("channels", []) if cached else []
-    rows = roku_content.build_rows(channels, category)
-    return ContentRowsResponse(
-        category=iptv.coerce_category(category, ""),
-        rows=rows,
-        total_rows=len(rows),
+    return Response(
+        content=roku_content.rows_body(cached, category),
+        media_type="application/json",
     )
 
 
@@ -540,6 +709,6 @@ def roku_status() -> dict:
 # ============================================================================
 
 @router.get("/health")
-def health() -> JSONResponse:
+async def health() -> ORJSONResponse:
     """Basic health check."""
-    return JSONResponse({"status": "ok"})
+    return ORJSONResponse({"status": "ok"})
@@ -3,16 +3,21 @@
 from __future__ import annotations
 
 from pathlib import Path
-import json
 import logging
+import os
 import threading
 
+import orjson
+
 from backend.app.config import get_settings
 from backend.app.models import CredentialsIn
 
 LOGGER = logging.getLogger(__name__)
 
 _LOCK = threading.Lock()
+# Last parsed credentials, keyed by the file's (mtime_ns, size) when read.
+_CACHED: CredentialsIn | None = None
+_CACHED_KEY: tuple[int, int] | None = None
 
 
 def _credentials_path() -> Path:
@@ -22,10 +27,17 @@ def _credentials_path() -> Path:
 
 def _atomic_write(path: Path, payload: dict[str, str]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_suffix(".tmp")
-    with tmp.open("w", encoding="utf-8") as fh:
-        json.dump(payload, fh, ensure_ascii=False, separators=(",", ":"))
-    tmp.replace(path)
+    tmp = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+    try:
+        with tmp.open("wb") as fh:
+            fh.write(orjson.dumps(payload))
+            if get_settings().cache_durable_fsync:
+                fh.flush()
+                os.fsync(fh.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def save_credentials(credentials: CredentialsIn) -> None:
@@ -33,33 +45,60 @@ def save_credentials(credentials: CredentialsIn) -> None:
 
     Security note: credentials are stored locally on disk in a Git-ignored
     location to prevent accidental commits.
+
+    The saved value also primes the in-memory cache, so the next
+    ``load_credentials`` call does not re-read the file it just wrote.
     """
+    global _CACHED, _CACHED_KEY
     payload = credentials.model_dump()
     path = _credentials_path()
     with _LOCK:
         _atomic_write(path, payload)
+        st = path.stat()
+        _CACHED, _CACHED_KEY = credentials, (st.st_mtime_ns, st.st_size)
     LOGGER.info("[ACCOUNT] Credentials saved successfully host=%s", credentials.host)
 
 
 def load_credentials() -> CredentialsIn | None:
-    """Load credentials from disk. Returns None if missing or invalid."""
+    """Load credentials from disk. Returns None if missing or invalid.
+
+    The parsed result is reused until the file's mtime or size changes.
+    """
+    global _CACHED, _CACHED_KEY
     path = _credentials_path()
-    if not path.exists():
+    try:
+        st = path.stat()
+    except OSError:
         LOGGER.info("[ACCOUNT] No saved credentials found")
         return None
 
+    if (st.st_mtime_ns, st.st_size) == _CACHED_KEY:
+        return _CACHED
+
+    credentials: CredentialsIn | None = None
     try:
-        with _LOCK, path.open("r", encoding="utf-8") as fh:
-            payload = json.load(fh)
+        # Key the result on the opened file itself, so a save landing between
+        # the stat above and this read cannot pair old content with a new key.
+        with _LOCK, path.open("rb") as fh:
+            st = os.fstat(fh.fileno())
+            data = fh.read()
+    except FileNotFoundError:
+        LOGGER.info("[ACCOUNT] No saved credentials found")
+        return None
+    except OSError:
+        LOGGER.exception("[ACCOUNT] Failed to load saved credentials")
+        return None
+    key = (st.st_mtime_ns, st.st_size)
+    try:
+        payload = orjson.loads(data)
         credentials = CredentialsIn.model_validate(payload)
         LOGGER.info("[ACCOUNT] Loaded credentials for host=%s", credentials.host)
-        return credentials
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         LOGGER.warning("[ACCOUNT] Credentials file is corrupted")
-        return None
     except Exception:
         LOGGER.exception("[ACCOUNT] Failed to load saved credentials")
-        return None
+    _CACHED, _CACHED_KEY = credentials, key
+    return credentials
 
 
 def has_credentials() -> bool:
@@ -69,11 +108,12 @@ def has_credentials() -> bool:
 
 def clear_credentials() -> None:
     """Remove credentials from disk if present."""
+    global _CACHED, _CACHED_KEY
     path = _credentials_path()
     try:
         with _LOCK:
-            if path.exists():
-                path.unlink()
+            _CACHED, _CACHED_KEY = None, None
+            path.unlink(missing_ok=True)
         LOGGER.info("[ACCOUNT] Credentials cleared successfully")
     except Exception:
         LOGGER.exception("[ACCOUNT] Failed to clear credentials")
@@ -6,20 +6,30 @@ Responsibilities:
 - Thread-safe refresh state
 - Cache validation (TTL / host)
 - Precomputed stats & categories (O(1) endpoints)
+- Category / group offset indexes for /channels filtering
+- Pre-encoded /stats and /groups bodies (built once per loaded payload)
+- Summary sidecar with the /status scalars
 """
 
 from __future__ import annotations
 
-import json
+import heapq
 import logging
+import mmap
 import os
 import sys
 import threading
 import time
+from bisect import bisect_right
+from collections import Counter
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import Any, Iterable
 
+import orjson
+
 from backend.app.config import get_settings
 from backend.app.services import iptv
 
@@ -30,27 +40,80 @@ LOGGER = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 _CACHE_LOCK = threading.Lock()
-_REFRESH_LOCK = threading.Lock()
-_REFRESHING = False
-_REFRESH_METADATA_LOCK = threading.Lock()
+# One lock guards every refresh-state global below; the flag itself is an
+# Event so is_refreshing() can poll it without taking the lock.
+_STATE_LOCK = threading.Lock()
+_REFRESH_EVENT = threading.Event()
 _LAST_REFRESH_STATUS: str | None = None
 _LAST_REFRESH_ERROR: str | None = None
 _LAST_SUCCESSFUL_REFRESH: str | None = None
 _REFRESH_STARTED_AT: str | None = None
 _REFRESH_HEARTBEAT_AT: str | None = None
+# Epoch-second twins of the ISO timestamps above, so /status can compute ages
+# with a subtraction instead of parsing the strings on every poll.
+_REFRESH_STARTED_TS: float | None = None
+_REFRESH_HEARTBEAT_TS: float | None = None
+# Parsed payload keyed on the cache file's (st_mtime_ns, st_size); swapped as
+# one tuple so readers never pair a payload with another file's key.
+_MEMO: tuple[tuple[int, int], dict[str, Any]] | None = None
 _LOAD_LOG_COUNT = 0
 _LOAD_LOG_LIMIT = 5
-_CACHE_SCHEMA_VERSION = 1
+# Bump whenever the on-disk channel shape changes: load_cache only trusts
+# channels as already normalized when the stored version matches.
+_CACHE_SCHEMA_VERSION = 2
+_STATS_KEYS = ("tv", "movies", "series", "other")
+_STATS_CATEGORIES = frozenset(_STATS_KEYS)
+_SEARCH_GRAM_SIZE = 3
+_HAYSTACK_DENSITY_LIMIT = 20
+_MMAP_MIN_BYTES = 64 * 1024
+_WRITE_BATCH_BYTES = 1024 * 1024
+_GROUPS_TOP_LIMIT = 200
+_SUMMARY_FIELDS = (
+    "host",
+    "timestamp",
+    "channel_count",
+    "last_refresh_status",
+    "last_refresh_error",
+    "last_successful_refresh",
+)
+_GROUP_HITS_LIMIT = 256
+# Refresh outcome fields kept in refresh_meta.json rather than channels.json,
+# so recording a failure never rewrites the channel list.
+_REFRESH_META_FIELDS = (
+    "last_refresh_status",
+    "last_refresh_error",
+    "last_successful_refresh",
+)
 _CREATED_BY = "iptv-backend"
-
+# Playlists repeat a few hundred (category, group) pairs across tens of
+# thousands of channels, and the mapping is pure, so memoize it.
+_coerce_cached = lru_cache(maxsize=4096)(iptv.coerce_category)
+
+
+@lru_cache(maxsize=4)
+def _cache_files(cache_dir: Path) -> tuple[Path, Path, Path]:
+    # Every /status poll resolves these; build the Path objects once per dir.
+    return (
+        cache_dir / "channels.json",
+        cache_dir / "channels.summary.json",
+        cache_dir / "refresh_meta.json",
+    )
 
 
 def get_cache_path() -> Path:
     """Return the cache file path (outside the repo by default)."""
-    settings = get_settings()
-    return settings.cache_dir / "channels.json"
+    return _cache_files(get_settings().cache_dir)[0]
+
+
+def get_summary_path() -> Path:
+    """Return the path of the small summary sidecar written next to the cache."""
+    return _cache_files(get_settings().cache_dir)[1]
 
 
+def get_refresh_meta_path() -> Path:
+    """Return the path of the refresh-outcome file written next to the cache."""
+    return _cache_files(get_settings().cache_dir)[2]
+
 # ---------------------------------------------------------------------------
 # INTERNAL HELPERS
 # ---------------------------------------------------------------------------
@@ -60,20 +123,73 @@ def _now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _write_payload(fh: Any, payload: dict[str, Any]) -> None:
+    """Write ``payload`` as compact JSON, streaming the channels array.
+
+    The output is byte-for-byte what ``orjson.dumps`` would produce, but the
+    channel rows are encoded one at a time and written in ~1 MB batches, so a
+    save never holds a second full-size copy of the cache in memory.
+    """
+    sep = b"{"
+    for key, value in payload.items():
+        fh.write(sep + orjson.dumps(key) + b":")
+        sep = b","
+        if key != "channels" or not isinstance(value, list):
+            fh.write(orjson.dumps(value))
+            continue
+        fh.write(b"[")
+        lead = b""
+        batch: list[bytes] = []
+        pending = 0
+        for ch in value:
+            row = orjson.dumps(ch)
+            batch.append(row)
+            pending += len(row)
+            if pending >= _WRITE_BATCH_BYTES:
+                fh.write(lead)
+                fh.write(b",".join(batch))
+                lead, batch, pending = b",", [], 0
+        if batch:
+            fh.write(lead)
+            fh.write(b",".join(batch))
+        fh.write(b"]")
+    fh.write(b"{}\n" if sep == b"{" else b"}\n")
+
+
 def _atomic_write(path: Path, payload: dict[str, Any]) -> int:
-    """Write JSON payload to disk atomically."""
+    """Write JSON payload to disk atomically.
+
+    The rename alone guarantees readers never see a partial file; the fsyncs
+    of the file and (on POSIX) its directory, which make the rename survive a
+    crash, are only paid when ``CACHE_DURABLE_FSYNC`` is enabled.
+    """
+    settings = get_settings()
     path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_suffix(".tmp")
+    # A per-process temp name keeps workers from clobbering each other's
+    # half-written file when they save at the same time.
+    tmp = path.with_name(f"{path.name}.tmp-{os.getpid()}")
     start = time.monotonic()
-    with tmp.open("w", encoding="utf-8") as fh:
-        json.dump(payload, fh, ensure_ascii=False, separators=(",", ":"))
-        fh.write("\n")
-        fh.flush()
-        os.fsync(fh.fileno())
-        size = fh.tell()
-    tmp.replace(path)
+    try:
+        with tmp.open("wb") as fh:
+            _write_payload(fh, payload)
+            size = fh.tell()
+            if settings.cache_durable_fsync:
+                fh.flush()
+                os.fsync(fh.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        # Nothing else will ever reuse this pid-specific name, so a failed
+        # write has to clean up after itself.
+        tmp.unlink(missing_ok=True)
+        raise
+    if settings.cache_durable_fsync and os.name == "posix":
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
     elapsed = time.monotonic() - start
-    if get_settings().debug:
+    if settings.debug:
         LOGGER.info(
             "Atomic write complete tmp=%s final=%s bytes=%d elapsed=%.2fs exists=%s",
             tmp.resolve(),
@@ -85,10 +201,46 @@ def _atomic_write(path: Path, payload: dict[str, Any]) -> int:
     return size
 
 
+def _read_json(path: Path, size: int) -> Any:
+    """Parse a JSON file through a read-only mmap instead of a bytes copy.
+
+    Files under ``_MMAP_MIN_BYTES`` are read directly; mapping them costs more
+    than the copy it avoids.
+    """
+    with path.open("rb") as fh:
+        if size < _MMAP_MIN_BYTES:
+            return orjson.loads(fh.read())
+        try:
+            mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # The file was truncated after the stat; read whatever is there.
+            mapped = None
+        if mapped is None:
+            return orjson.loads(fh.read())
+    # The mapping is closed before returning so it never pins the file
+    # (Windows refuses to replace a mapped file).
+    with mapped, memoryview(mapped) as view:
+        return orjson.loads(view)
+
+
+def _file_key(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def invalidate_memory_cache() -> None:
+    """Drop the in-process copy so the next ``load_cache`` re-reads the file."""
+    global _MEMO
+    with _CACHE_LOCK:
+        _MEMO = None
+
+
 def _invalidate_cache_file(path: Path, reason: str) -> None:
     """Move a corrupted cache file aside so it is not reused."""
-    if not path.exists():
-        return
+    invalidate_memory_cache()
     try:
         timestamp = _now().strftime("%Y%m%dT%H%M%S")
         quarantined = path.with_suffix(f".corrupt-{timestamp}.json")
@@ -99,34 +251,74 @@ def _invalidate_cache_file(path: Path, reason: str) -> None:
             path.resolve(),
             quarantined.resolve(),
         )
+    except FileNotFoundError:
+        return
     except Exception:
         LOGGER.exception("Failed to invalidate cache file path=%s", path.resolve())
 
 
-def _normalize_channel(channel: dict[str, Any]) -> dict[str, Any]:
-    """Ensure required channel fields exist."""
+def _normalize_channel(
+    channel: dict[str, Any],
+    shared_groups: dict[str, tuple[str, str]] | None = None,
+) -> dict[str, Any]:
+    """Ensure required channel fields exist.
+
+    Also stores lowercase shadow keys (``_name_l``, ``_group_l``) used by the
+    /channels filters; ``category`` is already lowercase after coercion.
+    ``shared_groups`` maps a group title to its shared (title, lowercase)
+    pair, so a batch lowercases each group once and reuses one ``str`` each.
+    """
     channel.setdefault("name", "Unknown")
     channel.setdefault("url", "about:blank")
-    group = str(channel.get("group") or "Unknown").strip() or "Unknown"
+    # Parsed playlists already hold clean strings; only strip when needed.
+    group = channel.get("group")
+    if not isinstance(group, str) or not group or group[0].isspace() or group[-1].isspace():
+        group = str(group or "Unknown").strip() or "Unknown"
+    if shared_groups is None:
+        group_l = group.lower()
+    else:
+        shared = shared_groups.get(group)
+        if shared is None:
+            shared = shared_groups[group] = (group, group.lower())
+        group, group_l = shared
     channel["group"] = group
-    raw_category = str(channel.get("category") or "").strip()
-    channel["category"] = iptv.coerce_category(raw_category, group)
+    category = channel.get("category")
+    if not isinstance(category, str) or category[:1].isspace() or category[-1:].isspace():
+        category = str(category or "").strip()
+    channel["category"] = _coerce_cached(category, group)
+    channel["_name_l"] = str(channel["name"]).lower()
+    channel["_group_l"] = group_l
     return channel
 
 
+def _share_strings(channels: list[dict[str, Any]]) -> None:
+    """Point equal group/category values at one shared ``str`` each.
+
+    orjson allocates every value separately, so a large cache would otherwise
+    keep one copy of each group title (and its lowercase twin) per channel.
+    """
+    share = {}.setdefault
+    for ch in channels:
+        if isinstance(ch, dict):
+            group = ch["group"]
+            ch["group"] = share(group, group)
+            group_l = ch["_group_l"]
+            ch["_group_l"] = share(group_l, group_l)
+            category = ch["category"]
+            ch["category"] = share(category, category)
+
+
 def _compute_stats(channels: Iterable[dict[str, Any]]) -> dict[str, int]:
-    """Compute IPTV category statistics (ONE TIME)."""
-    stats = {
-        "tv": 0,
-        "movies": 0,
-        "series": 0,
-        "other": 0,
-    }
+    """Compute IPTV category statistics (ONE TIME).
+
+    Expects channels that went through ``_normalize_channel``, whose
+    ``category`` is already canonical, so no re-coercion happens here.
+    """
+    stats = dict.fromkeys(_STATS_KEYS, 0)
 
     for ch in channels:
-        raw_category = str(ch.get("category") or "").strip()
-        normalized = iptv.coerce_category(raw_category, str(ch.get("group") or ""))
-        stats[normalized if normalized in stats else "other"] += 1
+        category = ch.get("category", "other")
+        stats[category if category in _STATS_CATEGORIES else "other"] += 1
 
     stats["total"] = sum(stats.values())
     return stats
@@ -134,11 +326,73 @@ def _compute_stats(channels: Iterable[dict[str, Any]]) -> dict[str, int]:
 
 def _compute_group_counts(channels: Iterable[dict[str, Any]]) -> dict[str, int]:
     """Compute raw group-title counts for fast /groups endpoint."""
-    counts: dict[str, int] = {}
-    for ch in channels:
-        group = str(ch.get("group") or "Unknown").strip() or "Unknown"
-        counts[group] = counts.get(group, 0) + 1
-    return counts
+    return Counter(
+        str(ch.get("group") or "Unknown").strip() or "Unknown" for ch in channels
+    )
+
+
+def _top_groups(group_counts: dict[str, int]) -> list[list[Any]]:
+    """Return the most common ``[group, count]`` pairs for /groups, ties by name."""
+    return [
+        [group, count]
+        for group, count in heapq.nsmallest(
+            _GROUPS_TOP_LIMIT,
+            group_counts.items(),
+            key=lambda item: (-item[1], item[0].lower()),
+        )
+    ]
+
+
+def _build_indexes(
+    channels: list[dict[str, Any]],
+) -> tuple[dict[str, list[int]], dict[str, list[int]]]:
+    """Build category and lowercase-group offset indexes for /channels."""
+    by_category: dict[str, list[int]] = {}
+    by_group: dict[str, list[int]] = {}
+    for idx, ch in enumerate(channels):
+        by_category.setdefault(ch["category"], []).append(idx)
+        by_group.setdefault(ch["_group_l"], []).append(idx)
+    return by_category, by_group
+
+
+def _build_search_index(channels: list[dict[str, Any]]) -> dict[str, list[int]]:
+    """Map each lowercase name trigram to the offsets of channels containing it."""
+    size = _SEARCH_GRAM_SIZE
+    index: dict[str, list[int]] = {}
+    for idx, ch in enumerate(channels):
+        name = ch["_name_l"]
+        for gram in {name[i : i + size] for i in range(len(name) - size + 1)}:
+            index.setdefault(gram, []).append(idx)
+    return index
+
+
+def _build_name_haystack(names: list[str]) -> tuple[str, list[int]]:
+    """Join lowercase names into one newline-separated string plus start offsets.
+
+    Playlist names come from single M3U lines, so they never contain ``\n``.
+    """
+    starts: list[int] = []
+    position = 0
+    for name in names:
+        starts.append(position)
+        position += len(name) + 1
+    return "\n".join(names), starts
+
+
+def _haystack_matches(haystack: str, starts: list[int], needle: str) -> list[int]:
+    """Return offsets of names containing ``needle`` using C-level ``str.find``."""
+    matches: list[int] = []
+    count = len(starts)
+    find = haystack.find
+    position = find(needle)
+    while position != -1:
+        idx = bisect_right(starts, position) - 1
+        matches.append(idx)
+        # Resume at the next name so each channel is reported once.
+        if idx + 1 >= count:
+            break
+        position = find(needle, starts[idx + 1])
+    return matches
 
 
 # ---------------------------------------------------------------------------
@@ -148,68 +402,105 @@ def _compute_group_counts(channels: Iterable[dict[str, Any]]) -> dict[str, int]:
 
 def is_refreshing() -> bool:
     """Return whether a refresh job is currently running."""
-    with _REFRESH_LOCK:
-        return _REFRESHING
+    return _REFRESH_EVENT.is_set()
 
 
 def set_refreshing(value: bool) -> None:
     """Set the refresh-in-progress flag."""
-    global _REFRESHING, _REFRESH_STARTED_AT, _LAST_REFRESH_STATUS, _REFRESH_HEARTBEAT_AT
-    with _REFRESH_LOCK:
-        _REFRESHING = value
-        _REFRESH_STARTED_AT = _now().isoformat() if value else None
-        _REFRESH_HEARTBEAT_AT = _now().isoformat() if value else None
-    if value:
-        with _REFRESH_METADATA_LOCK:
+    global _REFRESH_STARTED_AT, _LAST_REFRESH_STATUS, _REFRESH_HEARTBEAT_AT
+    global _REFRESH_STARTED_TS, _REFRESH_HEARTBEAT_TS
+    now = _now() if value else None
+    with _STATE_LOCK:
+        if value:
+            _REFRESH_EVENT.set()
             _LAST_REFRESH_STATUS = "loading"
-    else:
-        with _REFRESH_METADATA_LOCK:
-            _REFRESH_HEARTBEAT_AT = None
+        else:
+            _REFRESH_EVENT.clear()
+        _REFRESH_STARTED_AT = now.isoformat() if now else None
+        _REFRESH_STARTED_TS = now.timestamp() if now else None
+        _REFRESH_HEARTBEAT_AT = _REFRESH_STARTED_AT
+        _REFRESH_HEARTBEAT_TS = _REFRESH_STARTED_TS
 
 
 def try_set_refreshing() -> bool:
     """Atomically set the refreshing flag if not already set."""
-    global _REFRESHING, _REFRESH_STARTED_AT, _LAST_REFRESH_STATUS, _REFRESH_HEARTBEAT_AT
-    with _REFRESH_LOCK:
-        if _REFRESHING:
+    global _REFRESH_STARTED_AT, _LAST_REFRESH_STATUS, _REFRESH_HEARTBEAT_AT
+    global _REFRESH_STARTED_TS, _REFRESH_HEARTBEAT_TS
+    with _STATE_LOCK:
+        if _REFRESH_EVENT.is_set():
             return False
-        _REFRESHING = True
-        _REFRESH_STARTED_AT = _now().isoformat()
+        now = _now()
+        _REFRESH_EVENT.set()
+        _REFRESH_STARTED_AT = now.isoformat()
+        _REFRESH_STARTED_TS = now.timestamp()
         _REFRESH_HEARTBEAT_AT = _REFRESH_STARTED_AT
-    with _REFRESH_METADATA_LOCK:
+        _REFRESH_HEARTBEAT_TS = _REFRESH_STARTED_TS
         _LAST_REFRESH_STATUS = "loading"
         return True
 
 
 def set_last_error(error: str | None) -> None:
-    """Persist the last refresh error in memory."""
+    """Record the last refresh outcome in memory and in refresh_meta.json."""
     global _LAST_REFRESH_STATUS, _LAST_REFRESH_ERROR
-    with _REFRESH_METADATA_LOCK:
+    with _STATE_LOCK:
         _LAST_REFRESH_STATUS = "failed" if error else "success"
         _LAST_REFRESH_ERROR = error
+        meta = {
+            "last_refresh_status": _LAST_REFRESH_STATUS,
+            "last_refresh_error": _LAST_REFRESH_ERROR,
+            "last_successful_refresh": _LAST_SUCCESSFUL_REFRESH,
+        }
+    try:
+        _atomic_write(get_refresh_meta_path(), meta)
+    except Exception:
+        LOGGER.exception("Failed to write refresh metadata")
 
 
 def get_refresh_started_at() -> str | None:
     """Return the timestamp when refresh was set in motion."""
-    with _REFRESH_LOCK:
+    with _STATE_LOCK:
         return _REFRESH_STARTED_AT
 
 
 def set_refresh_heartbeat_at(value: str | None = None) -> None:
     """Set or clear the refresh heartbeat timestamp."""
-    global _REFRESH_HEARTBEAT_AT
-    with _REFRESH_METADATA_LOCK:
-        _REFRESH_HEARTBEAT_AT = value or _now().isoformat()
+    global _REFRESH_HEARTBEAT_AT, _REFRESH_HEARTBEAT_TS
+    now = datetime.fromisoformat(value) if value else _now()
+    with _STATE_LOCK:
+        _REFRESH_HEARTBEAT_AT = value or now.isoformat()
+        _REFRESH_HEARTBEAT_TS = now.timestamp()
 
 
 def get_refresh_heartbeat_at() -> str | None:
     """Return last refresh heartbeat timestamp."""
-    with _REFRESH_METADATA_LOCK:
+    with _STATE_LOCK:
         return _REFRESH_HEARTBEAT_AT
 
 
 def get_refresh_metadata(cache_payload: dict[str, Any] | None) -> dict[str, Any]:
     """Return refresh metadata, favoring in-memory state."""
+    with _STATE_LOCK:
+        return _refresh_metadata_locked(cache_payload)
+
+
+def get_refresh_snapshot(cache_payload: dict[str, Any] | None) -> dict[str, Any]:
+    """Return all in-memory refresh state for /status in one pass.
+
+    Combines ``is_refreshing``, ``get_refresh_started_at``,
+    ``get_refresh_heartbeat_at`` and ``get_refresh_metadata`` so a poll takes
+    the state lock once and sees a consistent view.
+    """
+    with _STATE_LOCK:
+        snapshot = _refresh_metadata_locked(cache_payload)
+        snapshot["refreshing"] = _REFRESH_EVENT.is_set()
+        snapshot["refresh_started_at"] = _REFRESH_STARTED_AT
+        snapshot["refresh_started_ts"] = _REFRESH_STARTED_TS
+        snapshot["refresh_heartbeat_at"] = _REFRESH_HEARTBEAT_AT
+        snapshot["refresh_heartbeat_ts"] = _REFRESH_HEARTBEAT_TS
+    return snapshot
+
+
+def _refresh_metadata_locked(cache_payload: dict[str, Any] | None) -> dict[str, Any]:
     if cache_payload is None:
         cached_status = None
         cached_error = None
@@ -219,10 +510,9 @@ def get_refresh_metadata(cache_payload: dict[str, Any] | None) -> dict[str, Any]
         cached_error = cache_payload.get("last_refresh_error")
         cached_success = cache_payload.get("last_successful_refresh")
 
-    with _REFRESH_METADATA_LOCK:
-        status = _LAST_REFRESH_STATUS or cached_status or ("missing" if cache_payload is None else "success")
-        error = _LAST_REFRESH_ERROR if _LAST_REFRESH_ERROR is not None else cached_error
-        last_success = _LAST_SUCCESSFUL_REFRESH or cached_success
+    status = _LAST_REFRESH_STATUS or cached_status or ("missing" if cache_payload is None else "success")
+    error = _LAST_REFRESH_ERROR if _LAST_REFRESH_ERROR is not None else cached_error
+    last_success = _LAST_SUCCESSFUL_REFRESH or cached_success
 
     return {
         "refresh_status": status,
@@ -237,13 +527,20 @@ def get_refresh_metadata(cache_payload: dict[str, Any] | None) -> dict[str, Any]
 
 
 def load_cache() -> dict[str, Any] | None:
-    """Load cached channel data from disk."""
-    global _LOAD_LOG_COUNT
-    cache_path = get_cache_path()
-    should_log = get_settings().debug or _LOAD_LOG_COUNT < _LOAD_LOG_LIMIT
+    """Load cached channel data, reusing the in-memory copy while unchanged."""
+    global _LOAD_LOG_COUNT, _MEMO
+    settings = get_settings()
+    cache_path = _cache_files(settings.cache_dir)[0]
+    key = _file_key(cache_path)
+    memo = _MEMO
+    if key is not None and memo is not None and memo[0] == key:
+        return memo[1]
+
+    should_log = settings.debug or _LOAD_LOG_COUNT < _LOAD_LOG_LIMIT
     if should_log:
         _LOAD_LOG_COUNT += 1
-    if not cache_path.exists():
+    if key is None:
+        _MEMO = None
         if should_log:
             LOGGER.info(
                 "Cache read attempt: path=%s exists=false",
@@ -254,14 +551,15 @@ def load_cache() -> dict[str, Any] | None:
 
     try:
         if should_log:
-            size_bytes = cache_path.stat().st_size
             LOGGER.info(
                 "Cache read attempt: path=%s exists=true size_bytes=%s",
                 cache_path.resolve(),
-                size_bytes,
+                key[1],
             )
-        with _CACHE_LOCK, cache_path.open("r", encoding="utf-8") as fh:
-            payload = json.load(fh)
+        # No lock: save_cache publishes via atomic rename, so this read sees
+        # either the old or the new file, never a partial one, and does not
+        # wait behind a writer's fsync. A stale result is caught by the key.
+        payload = _read_json(cache_path, key[1])
 
         channels = payload.get("channels")
         if not isinstance(channels, list):
@@ -269,30 +567,41 @@ def load_cache() -> dict[str, Any] | None:
             _invalidate_cache_file(cache_path, "invalid_channels_payload")
             return None
 
-        # Normalize channels in-place
-        for ch in channels:
-            if isinstance(ch, dict):
-                _normalize_channel(ch)
+        # save_cache writes channels already normalized; only files from an
+        # older schema (or written by hand) need the in-place pass.
+        header = payload.get("cache_header")
+        if not isinstance(header, dict) or header.get("schema_version") != _CACHE_SCHEMA_VERSION:
+            for ch in channels:
+                if isinstance(ch, dict):
+                    _normalize_channel(ch)
+        _share_strings(channels)
 
         payload.setdefault("channel_count", len(channels))
 
         stats = payload.get("stats")
-        if not isinstance(stats, dict):
+        if not isinstance(stats, dict) or any(key not in stats for key in _STATS_KEYS):
             stats = _compute_stats(channels)
             payload["stats"] = stats
         if "total" not in stats:
             stats["total"] = payload.get("channel_count", len(channels))
 
-        payload.setdefault(
-            "categories",
-            sorted({ch.get("category", "other") for ch in channels}),
-        )
-
-        payload.setdefault("group_counts", _compute_group_counts(channels))
+        if not isinstance(payload.get("by_category"), dict) or not isinstance(
+            payload.get("by_group"), dict
+        ):
+            payload["by_category"], payload["by_group"] = _build_indexes(channels)
+        if "categories" not in payload:
+            # by_category already holds each category once; sort just its keys.
+            payload["categories"] = sorted(payload["by_category"])
+
+        if not isinstance(payload.get("group_counts"), dict):
+            payload["group_counts"] = _compute_group_counts(channels)
+        if not isinstance(payload.get("groups_top"), list):
+            payload["groups_top"] = _top_groups(payload["group_counts"])
         payload.setdefault("cache_header", {})
         payload.setdefault("last_refresh_status", "success")
         payload.setdefault("last_refresh_error", None)
         payload.setdefault("last_successful_refresh", payload.get("timestamp"))
+        payload.update(_read_refresh_meta())
 
         _sync_refresh_metadata(payload)
 
@@ -305,9 +614,10 @@ def load_cache() -> dict[str, Any] | None:
                 payload.get("host"),
             )
         LOGGER.debug("Channel cache loaded (%d channels)", len(channels))
+        _MEMO = (key, payload)
         return payload
 
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         LOGGER.exception("Channel cache JSON is invalid")
         _invalidate_cache_file(cache_path, "json_decode_error")
         return None
@@ -318,10 +628,28 @@ def load_cache() -> dict[str, Any] | None:
 
 def save_cache(host: str, channels: list[dict[str, Any]]) -> None:
     """Persist channels and precomputed metadata to disk."""
+    global _MEMO
     started_at = time.monotonic()
-    normalized = [_normalize_channel(ch) for ch in channels]
-    group_counts = _compute_group_counts(normalized)
-    stats = _compute_stats(normalized)
+    # One pass normalizes each channel and does the work of
+    # _compute_group_counts, _compute_stats and _build_indexes; load_cache
+    # still uses those helpers for older or partial files.
+    normalized: list[dict[str, Any]] = []
+    group_counts: Counter[str] = Counter()
+    stats = dict.fromkeys(_STATS_KEYS, 0)
+    by_category: dict[str, list[int]] = {}
+    by_group: dict[str, list[int]] = {}
+    shared_groups: dict[str, tuple[str, str]] = {}
+    for idx, ch in enumerate(channels):
+        _normalize_channel(ch, shared_groups)
+        group = ch["group"]
+        category = ch["category"]
+        group_l = ch["_group_l"]
+        normalized.append(ch)
+        group_counts[group] += 1
+        stats[category if category in _STATS_CATEGORIES else "other"] += 1
+        by_category.setdefault(category, []).append(idx)
+        by_group.setdefault(group_l, []).append(idx)
+    stats["total"] = len(normalized)
     timestamp = _now().isoformat()
 
     payload = {
@@ -330,8 +658,11 @@ def save_cache(host: str, channels: list[dict[str, Any]]) -> None:
         "channels": normalized,
         "channel_count": len(normalized),
         "stats": stats,
-        "categories": sorted({ch["category"] for ch in normalized}),
+        "categories": sorted(by_category),
         "group_counts": group_counts,
+        "groups_top": _top_groups(group_counts),
+        "by_category": by_category,
+        "by_group": by_group,
         "cache_header": {
             "schema_version": _CACHE_SCHEMA_VERSION,
             "created_by": _CREATED_BY,
@@ -339,14 +670,20 @@ def save_cache(host: str, channels: list[dict[str, Any]]) -> None:
             "cwd": os.getcwd(),
             "python_executable": sys.executable,
         },
-        "last_refresh_status": "success",
-        "last_refresh_error": None,
-        "last_successful_refresh": timestamp,
     }
 
     cache_path = get_cache_path()
     with _CACHE_LOCK:
         bytes_written = _atomic_write(cache_path, payload)
+        # Refresh outcome fields live in refresh_meta.json on disk; the
+        # in-memory payload carries them like a freshly loaded one would.
+        payload["last_refresh_status"] = "success"
+        payload["last_refresh_error"] = None
+        payload["last_successful_refresh"] = timestamp
+        key = _file_key(cache_path)
+        _MEMO = (key, payload) if key is not None else None
+        if key is not None:
+            _write_summary(payload, key)
 
     elapsed = time.monotonic() - started_at
     LOGGER.info(
@@ -361,10 +698,68 @@ def save_cache(host: str, channels: list[dict[str, Any]]) -> None:
     _sync_refresh_metadata(payload)
 
 
+def _write_summary(payload: dict[str, Any], key: tuple[int, int]) -> None:
+    """Write the /status scalars next to the cache, tagged with its file key."""
+    summary = {field: payload.get(field) for field in _SUMMARY_FIELDS}
+    summary["cache_key"] = list(key)
+    try:
+        _atomic_write(get_summary_path(), summary)
+    except Exception:
+        LOGGER.exception("Failed to write cache summary")
+
+
+def memoized_cache() -> dict[str, Any] | None:
+    """Return the in-memory payload while it matches the cache file, else None.
+
+    Costs one ``stat`` and never parses, so async routes can call it on the
+    event loop and run ``load_cache`` in a worker thread only on a miss.
+    """
+    key = _file_key(get_cache_path())
+    memo = _MEMO
+    if key is not None and memo is not None and memo[0] == key:
+        return memo[1]
+    return None
+
+
+def load_summary(parse: bool = True) -> dict[str, Any] | None:
+    """Return the cache scalars /status needs without parsing the channels.
+
+    Uses the in-memory payload when it is current, else the summary sidecar
+    when it was written for the current cache file (e.g. another worker
+    refreshed it), and only falls back to ``load_cache`` otherwise. With
+    ``parse=False`` that fallback is skipped and None is returned instead.
+    """
+    key = _file_key(get_cache_path())
+    if key is None:
+        return None
+    memo = _MEMO
+    if memo is not None and memo[0] == key:
+        return memo[1]
+    try:
+        summary = orjson.loads(get_summary_path().read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        summary = None
+    if isinstance(summary, dict) and summary.get("cache_key") == list(key):
+        summary.update(_read_refresh_meta())
+        return summary
+    return load_cache() if parse else None
+
+
+def _read_refresh_meta() -> dict[str, Any]:
+    """Return the persisted refresh outcome fields, or {} if unavailable."""
+    try:
+        meta = orjson.loads(get_refresh_meta_path().read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    if not isinstance(meta, dict):
+        return {}
+    return {field: meta.get(field) for field in _REFRESH_META_FIELDS if field in meta}
+
+
 def _sync_refresh_metadata(payload: dict[str, Any]) -> None:
     """Sync refresh metadata from payload into memory."""
     global _LAST_REFRESH_STATUS, _LAST_REFRESH_ERROR, _LAST_SUCCESSFUL_REFRESH
-    with _REFRESH_METADATA_LOCK:
+    with _STATE_LOCK:
         _LAST_REFRESH_STATUS = payload.get("last_refresh_status")
         _LAST_REFRESH_ERROR = payload.get("last_refresh_error")
         _LAST_SUCCESSFUL_REFRESH = payload.get("last_successful_refresh")
@@ -409,35 +804,127 @@ def is_cache_valid(
 
 
 def get_stats(cache_payload: dict[str, Any] | None) -> dict[str, int]:
-    """Return cached stats (O(1))."""
-    empty = {
-        "tv": 0,
-        "movies": 0,
-        "series": 0,
-        "other": 0,
-        "total": 0,
-    }
+    """Return cached stats (O(1)).
+
+    ``save_cache`` computes the stats once per refresh and ``load_cache``
+    validates them once per file read, so this is a plain lookup.
+    """
     if not cache_payload:
-        return empty
-
-    channels = cache_payload.get("channels", [])
-    stats = cache_payload.get("stats")
-    if not isinstance(stats, dict) or any(
-        key not in stats for key in ("tv", "movies", "series", "other")
-    ):
-        stats = _compute_stats(channels)
-        cache_payload["stats"] = stats
-
-    stats["total"] = int(
-        stats.get(
-            "total",
-            cache_payload.get("channel_count", len(channels)),
-        )
-    )
-    return {
-        "tv": int(stats.get("tv", 0)),
-        "movies": int(stats.get("movies", 0)),
-        "series": int(stats.get("series", 0)),
-        "other": int(stats.get("other", 0)),
-        "total": int(stats.get("total", 0)),
-    }
+        return {key: 0 for key in _STATS_KEYS + ("total",)}
+    return cache_payload["stats"]
+
+
+def _encoded_body(cache_payload: dict[str, Any], key: str, build: Any) -> bytes:
+    body = cache_payload.get(key)
+    if body is None:
+        body = orjson.dumps(build())
+        cache_payload[key] = body
+    return body
+
+
+def stats_body(cache_payload: dict[str, Any] | None) -> bytes:
+    """Return the ``/stats`` JSON body, encoded once per loaded payload."""
+
+    def build() -> dict[str, int]:
+        stats = get_stats(cache_payload)
+        return {key: stats[key] for key in ("total",) + _STATS_KEYS}
+
+    if not cache_payload:
+        return orjson.dumps(build())
+    return _encoded_body(cache_payload, "_stats_body", build)
+
+
+def groups_body(cache_payload: dict[str, Any] | None) -> bytes:
+    """Return the ``/groups`` JSON body, encoded once per loaded payload."""
+
+    def build() -> dict[str, Any]:
+        return {
+            "categories": cache_payload.get("categories", []),
+            "groups": dict(cache_payload.get("groups_top", [])),
+        }
+
+    if not cache_payload:
+        return orjson.dumps({"categories": [], "groups": {}})
+    return _encoded_body(cache_payload, "_groups_body", build)
+
+
+def group_candidates(cache_payload: dict[str, Any], group_l: str) -> list[int]:
+    """Return sorted offsets of channels whose lowercase group contains ``group_l``.
+
+    Results are memoized per loaded payload (runtime-only ``_group_hits``),
+    since clients repeat the same few group filters while paging.
+    """
+    hits = cache_payload.get("_group_hits")
+    if hits is None:
+        hits = cache_payload["_group_hits"] = {}
+    offsets = hits.get(group_l)
+    if offsets is not None:
+        return offsets
+
+    # Groups are disjoint, so merging the matching buckets is a plain sort.
+    buckets = [
+        bucket for key, bucket in cache_payload["by_group"].items() if group_l in key
+    ]
+    offsets = buckets[0] if len(buckets) == 1 else sorted(chain.from_iterable(buckets))
+    if len(hits) >= _GROUP_HITS_LIMIT:
+        hits.clear()
+    hits[group_l] = offsets
+    return offsets
+
+
+def group_ready(cache_payload: dict[str, Any], group_l: str) -> bool:
+    """Return whether ``group_candidates`` has the offsets for ``group_l`` memoized."""
+    return group_l in cache_payload.get("_group_hits", ())
+
+
+def name_column(cache_payload: dict[str, Any]) -> list[str]:
+    """Return the lowercase channel names as one list, parallel to ``channels``.
+
+    Built lazily per loaded payload (runtime-only ``_names_l``) so scans walk
+    a flat list of strings instead of indexing into every channel dict.
+    """
+    names = cache_payload.get("_names_l")
+    if names is None:
+        names = [ch["_name_l"] for ch in cache_payload["channels"]]
+        cache_payload["_names_l"] = names
+    return names
+
+
+def search_candidates(cache_payload: dict[str, Any], search_l: str) -> list[int] | None:
+    """Return sorted offsets of channels whose name may contain ``search_l``.
+
+    Searches of at least a trigram use the trigram index; shorter ones are
+    matched exactly against a single joined name string. Both structures are
+    built lazily, once per loaded payload, and kept in memory only (they are
+    never written to disk). Trigram results are a superset that callers must
+    still verify with a substring check. ``None`` means a short search matches
+    too many names for the lookup to beat a plain scan.
+    """
+    size = _SEARCH_GRAM_SIZE
+    if len(search_l) < size:
+        haystack = cache_payload.get("_name_haystack")
+        if haystack is None:
+            haystack = _build_name_haystack(name_column(cache_payload))
+            cache_payload["_name_haystack"] = haystack
+        text, starts = haystack
+        if "\n" in search_l:
+            return []
+        # Each match costs a bisect, so dense one/two-letter searches are
+        # cheaper to scan; count() gives a fast upper bound on the matches.
+        if text.count(search_l) * _HAYSTACK_DENSITY_LIMIT > len(starts):
+            return None
+        return _haystack_matches(text, starts, search_l)
+
+    index = cache_payload.get("_search_index")
+    if index is None:
+        index = _build_search_index(cache_payload["channels"])
+        cache_payload["_search_index"] = index
+
+    best: list[int] | None = None
+    for i in range(len(search_l) - size + 1):
+        postings = index.get(search_l[i : i + size])
+        if postings is None:
+            return []
+        if best is None or len(postings) < len(best):
+            best = postings
+    return best
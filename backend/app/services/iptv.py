@@ -2,34 +2,36 @@
 
 from __future__ import annotations
 
-from typing import Any, Iterable
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Callable, Iterable, Iterator
+import codecs
+import heapq
 import logging
 import re
 import time
 from urllib.parse import urlparse
 
-import requests
-import urllib3
-from requests.adapters import HTTPAdapter
-
 from backend.app.config import get_settings
 from backend.app.models import CredentialsIn
 
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
 LOGGER = logging.getLogger(__name__)
 
+# Accept-Encoding is left to the session default, which advertises every
+# codec urllib3 can decode while streaming (gzip and deflate, plus br/zstd
+# when the brotli/zstandard packages are installed).
 HEADERS = {
     "User-Agent": "IPTVSmartersPro",
     "Connection": "close",
     "Accept": "*/*",
-    "Accept-Encoding": "gzip, deflate",
 }
 
 DEFAULT_FILTER_KEYWORDS = ["ufc", "paramount"]
+STREAM_CHUNK_SIZE = 64 * 1024
+PROGRESS_INTERVAL_SECONDS = 5.0
 ATTR_RE = re.compile(r'([A-Za-z0-9_-]+)="([^"]*)"')
 
-ALLOWED_CATEGORIES = {"tv", "movies", "series", "other"}
+ALLOWED_CATEGORIES: frozenset[str] = frozenset({"tv", "movies", "series", "other"})
 
 CATEGORY_KEYWORDS: list[tuple[str, tuple[str, ...]]] = [
     (
@@ -66,6 +68,12 @@ CATEGORY_KEYWORDS: list[tuple[str, tuple[str, ...]]] = [
         ),
     ),
 ]
+# One compiled alternation per family, tried in CATEGORY_KEYWORDS order so a
+# movies keyword still wins over a tv keyword that appears earlier in the title.
+_CATEGORY_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = tuple(
+    (category, re.compile("|".join(map(re.escape, keywords))))
+    for category, keywords in CATEGORY_KEYWORDS
+)
 
 class IPTVFetchError(RuntimeError):
     """Raised when IPTV playlist fetch fails after retries."""
@@ -76,6 +84,39 @@ class _FetchFailure(RuntimeError):
 
 
 
+@lru_cache
+def requests_module() -> ModuleType:
+    """Import ``requests`` on first use.
+
+    ``requests``/``urllib3`` are only needed by refresh and the debug selftest,
+    so keeping them out of module import trims backend cold start.
+    """
+
+    import requests
+    import urllib3
+
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    return requests
+
+
+@lru_cache
+def http_session() -> Any:
+    """Return the process-wide ``requests.Session`` used for provider calls.
+
+    Refresh and the debug selftest share one session so adapters and
+    connection pools are built once instead of per call.
+    """
+
+    requests = requests_module()
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 def _normalize_host(host: str) -> str:
     parsed = urlparse(host)
     if parsed.scheme:
@@ -92,8 +133,65 @@ def build_m3u_url(credentials: CredentialsIn) -> str:
     return f"http://{host}/playlist/{credentials.username}/{credentials.password}/m3u"
 
 
-def fetch_m3u(credentials: CredentialsIn, request_id: str | None = None) -> str:
-    """Fetch the M3U playlist for provided credentials."""
+class _PlaylistStream:
+    """Decode a streamed playlist body into lines while counting bytes.
+
+    ``on_progress`` is called at most every ``PROGRESS_INTERVAL_SECONDS`` while
+    chunks keep arriving.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        encoding: str,
+        on_progress: Callable[[], None] | None = None,
+    ) -> None:
+        self._chunks = chunks
+        try:
+            codec = codecs.lookup(encoding)
+        except LookupError:
+            # Providers send charset labels like "utf8mb4"; decode as UTF-8
+            # with replacement rather than failing the refresh.
+            codec = codecs.lookup("utf-8")
+        self._decoder = codec.incrementaldecoder(errors="replace")
+        self._on_progress = on_progress
+        self.bytes_read = 0
+        self.has_text = False
+
+    def __iter__(self) -> Iterator[str]:
+        pending = ""
+        on_progress = self._on_progress
+        last_progress = time.monotonic()
+        for chunk in self._chunks:
+            self.bytes_read += len(chunk)
+            if on_progress is not None:
+                now = time.monotonic()
+                if now - last_progress >= PROGRESS_INTERVAL_SECONDS:
+                    on_progress()
+                    last_progress = now
+            text = self._decoder.decode(chunk)
+            if not self.has_text and text.strip():
+                self.has_text = True
+            buffer = pending + text
+            lines = buffer.splitlines()
+            # Hold back a trailing partial line until the next chunk completes it.
+            pending = lines.pop() if lines and buffer.endswith(lines[-1]) else ""
+            yield from lines
+        pending += self._decoder.decode(b"", final=True)
+        yield from pending.splitlines()
+
+
+def fetch_m3u(
+    credentials: CredentialsIn,
+    request_id: str | None = None,
+    on_progress: Callable[[], None] | None = None,
+) -> list[dict]:
+    """Fetch the M3U playlist and parse it into channels while it streams.
+
+    The body is decoded and parsed line by line, so the full playlist text is
+    never held in memory. ``on_progress`` is called when each attempt starts
+    and periodically while the body is being received.
+    """
 
     if not credentials.host or not credentials.username or not credentials.password:
         raise RuntimeError("Incomplete IPTV credentials")
@@ -102,26 +200,26 @@ def fetch_m3u(credentials: CredentialsIn, request_id: str | None = None) -> str:
     url = build_m3u_url(credentials)
     LOGGER.info("[REFRESH] M3U download start request_id=%s url=%s", request_id, url)
 
-    session = requests.Session()
-    adapter = HTTPAdapter()
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
+    requests = requests_module()
+    session = http_session()
 
     attempts = 3
     last_exc: Exception | None = None
     last_reason: str | None = None
 
-    try:
-        for attempt in range(1, attempts + 1):
-            start = time.monotonic()
-            try:
-                response = session.get(
-                    url,
-                    headers=HEADERS,
-                    timeout=(10, 90),
-                    verify=settings.verify_ssl,
-                    allow_redirects=True,
-                )
+    for attempt in range(1, attempts + 1):
+        start = time.monotonic()
+        if on_progress is not None:
+            on_progress()
+        try:
+            with session.get(
+                url,
+                headers=HEADERS,
+                timeout=(10, 90),
+                verify=settings.verify_ssl,
+                allow_redirects=True,
+                stream=True,
+            ) as response:
                 elapsed = time.monotonic() - start
                 LOGGER.info(
                     "[REFRESH] attempt %s/%s response status=%s elapsed=%.2fs request_id=%s",
@@ -134,89 +232,95 @@ def fetch_m3u(credentials: CredentialsIn, request_id: str | None = None) -> str:
                 if response.status_code != 200:
                     raise _FetchFailure(f"HTTP {response.status_code}")
 
-                playlist_text = response.text or ""
-                LOGGER.info(
-                    "[REFRESH] M3U download complete: bytes=%s elapsed=%.2fs request_id=%s",
-                    len(playlist_text.encode("utf-8")),
-                    elapsed,
-                    request_id,
-                )
-                if not playlist_text.strip():
-                    raise _FetchFailure("empty playlist")
-                return playlist_text
-            except requests.exceptions.SSLError as exc:
-                elapsed = time.monotonic() - start
-                last_exc = exc
-                last_reason = "ssl_error"
-                LOGGER.warning(
-                    "[REFRESH] attempt %s/%s failed: ssl_error elapsed=%.2fs request_id=%s",
-                    attempt,
-                    attempts,
-                    elapsed,
-                    request_id,
-                )
-            except requests.exceptions.Timeout as exc:
-                elapsed = time.monotonic() - start
-                last_exc = exc
-                last_reason = "timeout"
-                LOGGER.warning(
-                    "[REFRESH] attempt %s/%s failed: timeout elapsed=%.2fs request_id=%s",
-                    attempt,
-                    attempts,
-                    elapsed,
-                    request_id,
-                )
-            except requests.exceptions.ConnectionError as exc:
-                elapsed = time.monotonic() - start
-                last_exc = exc
-                last_reason = "connection_error"
-                LOGGER.warning(
-                    "[REFRESH] attempt %s/%s failed: connection_error elapsed=%.2fs request_id=%s",
-                    attempt,
-                    attempts,
-                    elapsed,
-                    request_id,
-                )
-            except _FetchFailure as exc:
-                elapsed = time.monotonic() - start
-                last_exc = exc
-                last_reason = str(exc)
-                LOGGER.warning(
-                    "[REFRESH] attempt %s/%s failed: %s elapsed=%.2fs request_id=%s",
-                    attempt,
-                    attempts,
-                    exc,
-                    elapsed,
-                    request_id,
-                )
-            except requests.exceptions.RequestException as exc:
-                elapsed = time.monotonic() - start
-                last_exc = exc
-                last_reason = "request_error"
-                LOGGER.warning(
-                    "[REFRESH] attempt %s/%s failed: request_error elapsed=%.2fs request_id=%s",
-                    attempt,
-                    attempts,
-                    elapsed,
-                    request_id,
-                )
-            except Exception as exc:
-                elapsed = time.monotonic() - start
-                last_exc = exc
-                last_reason = "unexpected_error"
-                LOGGER.warning(
-                    "[REFRESH] attempt %s/%s failed: unexpected_error elapsed=%.2fs request_id=%s",
-                    attempt,
-                    attempts,
-                    elapsed,
-                    request_id,
+                stream = _PlaylistStream(
+                    response.iter_content(chunk_size=STREAM_CHUNK_SIZE),
+                    response.encoding or "utf-8",
+                    on_progress,
                 )
+                channels = list(parse_m3u_iter(stream, request_id=request_id))
+
+            elapsed = time.monotonic() - start
+            LOGGER.info(
+                "[REFRESH] M3U download complete: bytes=%s elapsed=%.2fs request_id=%s",
+                stream.bytes_read,
+                elapsed,
+                request_id,
+            )
+            if not stream.has_text:
+                raise _FetchFailure("empty playlist")
+            _log_parse_summary(channels, request_id)
+            return channels
+        except requests.exceptions.SSLError as exc:
+            elapsed = time.monotonic() - start
+            last_exc = exc
+            last_reason = "ssl_error"
+            LOGGER.warning(
+                "[REFRESH] attempt %s/%s failed: ssl_error elapsed=%.2fs request_id=%s",
+                attempt,
+                attempts,
+                elapsed,
+                request_id,
+            )
+        except requests.exceptions.Timeout as exc:
+            elapsed = time.monotonic() - start
+            last_exc = exc
+            last_reason = "timeout"
+            LOGGER.warning(
+                "[REFRESH] attempt %s/%s failed: timeout elapsed=%.2fs request_id=%s",
+                attempt,
+                attempts,
+                elapsed,
+                request_id,
+            )
+        except requests.exceptions.ConnectionError as exc:
+            elapsed = time.monotonic() - start
+            last_exc = exc
+            last_reason = "connection_error"
+            LOGGER.warning(
+                "[REFRESH] attempt %s/%s failed: connection_error elapsed=%.2fs request_id=%s",
+                attempt,
+                attempts,
+                elapsed,
+                request_id,
+            )
+        except _FetchFailure as exc:
+            elapsed = time.monotonic() - start
+            last_exc = exc
+            last_reason = str(exc)
+            LOGGER.warning(
+                "[REFRESH] attempt %s/%s failed: %s elapsed=%.2fs request_id=%s",
+                attempt,
+                attempts,
+                exc,
+                elapsed,
+                request_id,
+            )
+        except requests.exceptions.RequestException as exc:
+            elapsed = time.monotonic() - start
+            last_exc = exc
+            last_reason = "request_error"
+            LOGGER.warning(
+                "[REFRESH] attempt %s/%s failed: request_error elapsed=%.2fs request_id=%s",
+                attempt,
+                attempts,
+                elapsed,
+                request_id,
+            )
+        except Exception as exc:
+            elapsed = time.monotonic() - start
+            last_exc = exc
+            last_reason = "unexpected_error"
+            LOGGER.warning(
+                "[REFRESH] attempt %s/%s failed: unexpected_error elapsed=%.2fs request_id=%s",
+                attempt,
+                attempts,
+                elapsed,
+                request_id,
+            )
 
-            if attempt < attempts:
-                backoff = 2 ** (attempt - 1)
-                time.sleep(backoff)
-    finally:
-        session.close()
+        if attempt < attempts:
+            backoff = 2 ** (attempt - 1)
+            time.sleep(backoff)
 
     if last_reason == "ssl_error":
         message = "SSL verification failed (self-signed certificate)"
@@ -240,17 +344,26 @@ def _safe_text(value: str | None, fallback: str) -> str:
 
 EXTINF_LOG_LIMIT = 10
 PARSE_SAMPLE_LIMIT = 5
-KNOWN_ATTR_KEYS = {
-    "tvg-id",
-    "tvg-name",
-    "tvg-logo",
-    "tvg-chno",
-    "group-title",
-    "group",
-    "category",
-    "type",
-    "tvg-group",
-}
+KNOWN_ATTR_KEYS: frozenset[str] = frozenset(
+    {
+        "tvg-id",
+        "tvg-name",
+        "tvg-logo",
+        "tvg-chno",
+        "group-title",
+        "group",
+        "category",
+        "type",
+        "tvg-group",
+    }
+)
+# EXTINF attribute -> channel field, copied only when non-empty.
+_TVG_FIELDS: tuple[tuple[str, str], ...] = (
+    ("tvg-id", "tvg_id"),
+    ("tvg-name", "tvg_name"),
+    ("tvg-logo", "tvg_logo"),
+    ("tvg-chno", "tvg_chno"),
+)
 
 def _parse_extinf_line(line: str) -> tuple[dict[str, str], str]:
     """
@@ -300,8 +413,8 @@ def normalize_category(group: str) -> str:
     if not normalized:
         return "other"
 
-    for category, keywords in CATEGORY_KEYWORDS:
-        if any(keyword in normalized for keyword in keywords):
+    for category, pattern in _CATEGORY_PATTERNS:
+        if pattern.search(normalized):
             return category
     return "other"
 
@@ -319,11 +432,22 @@ def coerce_category(category: str | None, group: str | None = None) -> str:
 def parse_m3u(playlist_text: str, request_id: str | None = None) -> list[dict]:
     """Parse the M3U playlist into a list of normalized channel dictionaries."""
 
-    channels: list[dict[str, Any]] = []
+    channels = list(parse_m3u_iter(playlist_text.splitlines(), request_id=request_id))
+    _log_parse_summary(channels, request_id)
+    return channels
+
+
+def parse_m3u_iter(
+    lines: Iterable[str], request_id: str | None = None
+) -> Iterator[dict[str, Any]]:
+    """Yield normalized channel dictionaries from M3U playlist lines."""
+
     pending: dict[str, Any] | None = None
     extinf_logged = 0
+    # A playlist reuses a few hundred group titles; classify each one once.
+    categories: dict[str, str] = {}
 
-    for raw_line in playlist_text.splitlines():
+    for raw_line in lines:
         line = raw_line.strip()
         if not line:
             continue
@@ -356,10 +480,13 @@ def parse_m3u(playlist_text: str, request_id: str | None = None) -> list[dict]:
                 extinf_logged += 1
 
             group = _derive_group(attrs)
+            category = categories.get(group)
+            if category is None:
+                category = categories[group] = normalize_category(group)
             pending = {
-                "name": _safe_text(display_name, "Unknown"),
+                "name": display_name or "Unknown",
                 "group": group,
-                "category": normalize_category(group),
+                "category": category,
             }
             if extinf_logged <= EXTINF_LOG_LIMIT:
                 LOGGER.info(
@@ -369,26 +496,17 @@ def parse_m3u(playlist_text: str, request_id: str | None = None) -> list[dict]:
                     pending["category"],
                     display_name,
                 )
-            unknown_keys = sorted(set(attrs) - KNOWN_ATTR_KEYS)
-            if unknown_keys:
+            if not KNOWN_ATTR_KEYS.issuperset(attrs):
                 LOGGER.debug(
                     "[PARSE] Unknown EXTINF attrs request_id=%s keys=%s",
                     request_id,
-                    unknown_keys,
+                    sorted(set(attrs) - KNOWN_ATTR_KEYS),
                 )
-            tvg_id = _safe_text(attrs.get("tvg-id"), "")
-            tvg_name = _safe_text(attrs.get("tvg-name"), "")
-            tvg_logo = _safe_text(attrs.get("tvg-logo"), "")
-            tvg_chno = _safe_text(attrs.get("tvg-chno"), "")
-
-            if tvg_id:
-                pending["tvg_id"] = tvg_id
-            if tvg_name:
-                pending["tvg_name"] = tvg_name
-            if tvg_logo:
-                pending["tvg_logo"] = tvg_logo
-            if tvg_chno:
-                pending["tvg_chno"] = tvg_chno
+            # _parse_extinf_line already stripped the values and the name.
+            for attr, field in _TVG_FIELDS:
+                value = attrs.get(attr)
+                if value:
+                    pending[field] = value
             continue
 
         if line.startswith("#"):
@@ -397,23 +515,25 @@ def parse_m3u(playlist_text: str, request_id: str | None = None) -> list[dict]:
         url = _safe_text(line, "about:blank")
         if pending:
             pending["url"] = url
-            channels.append(pending)
+            yield pending
             pending = None
         else:
-            channels.append(
-                {
-                    "name": "Unknown",
-                    "group": "Unknown",
-                    "category": "other",
-                    "url": url,
-                }
-            )
+            yield {
+                "name": "Unknown",
+                "group": "Unknown",
+                "category": "other",
+                "url": url,
+            }
 
     if pending:
         pending["url"] = _safe_text(pending.get("url"), "about:blank")
-        channels.append(pending)
+        yield pending
+
 
-    if channels:
+def _log_parse_summary(channels: list[dict[str, Any]], request_id: str | None) -> None:
+    """Log a sample and the group/category distribution of parsed channels."""
+
+    if channels and LOGGER.isEnabledFor(logging.INFO):
         sample = channels[:PARSE_SAMPLE_LIMIT]
         LOGGER.info(
             "[PARSE] Sample channels request_id=%s sample=%s",
@@ -430,14 +550,13 @@ def parse_m3u(playlist_text: str, request_id: str | None = None) -> list[dict]:
         LOGGER.info(
             "[PARSE] Group distribution request_id=%s groups=%s",
             request_id,
-            dict(sorted(group_counts.items(), key=lambda item: item[1], reverse=True)[:10]),
+            dict(heapq.nlargest(10, group_counts.items(), key=lambda item: item[1])),
         )
         LOGGER.info(
             "[PARSE] Category distribution request_id=%s categories=%s",
             request_id,
             category_counts,
         )
-    return channels
 
 
 
@@ -449,10 +568,12 @@ def filter_channels(
     if not keywords:
         return list(channels)
     lowered = [keyword.lower() for keyword in keywords]
+    if not lowered:
+        return []
+    # One alternation scans each lowercased name once for every keyword.
+    search = re.compile("|".join(map(re.escape, lowered))).search
     filtered = [
-        channel
-        for channel in channels
-        if any(keyword in channel.get("name", "").lower() for keyword in lowered)
+        channel for channel in channels if search(channel.get("name", "").lower())
     ]
     LOGGER.debug("Filtered channels count=%s keywords=%s", len(filtered), lowered)
     return filtered
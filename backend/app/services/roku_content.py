@@ -5,6 +5,8 @@ from __future__ import annotations
 from collections import defaultdict
 from typing import Iterable
 
+import orjson
+
 from backend.app.services import iptv
 
 _ROW_LIMIT = 6
@@ -73,6 +75,37 @@ def build_rows(channels: Iterable[dict], category: str) -> list[dict]:
     return rows[:_ROW_LIMIT]
 
 
+def rows_body(cache_payload: dict | None, category: str) -> bytes:
+    """Return the encoded ``ContentRowsResponse`` for a category.
+
+    Rows only change with the cache, so each category's body is built once
+    per loaded payload and kept under the runtime-only ``_roku_rows`` key.
+    """
+
+    normalized_category = iptv.coerce_category(category, "")
+    bodies = None
+    if cache_payload:
+        bodies = cache_payload.get("_roku_rows")
+        if bodies is None:
+            bodies = cache_payload["_roku_rows"] = {}
+        body = bodies.get(normalized_category)
+        if body is not None:
+            return body
+
+    channels = cache_payload.get("channels", []) if cache_payload else []
+    rows = build_rows(channels, normalized_category)
+    body = orjson.dumps(
+        {
+            "category": normalized_category,
+            "rows": rows,
+            "total_rows": len(rows),
+        }
+    )
+    if bodies is not None:
+        bodies[normalized_category] = body
+    return body
+
+
 def build_status_payload(cache_payload: dict | None, refresh_metadata: dict | None = None, refreshing: bool = False, refresh_started_at: str | None = None) -> dict:
     """Return summary metrics used by Roku status panel."""
 
@@ -3,12 +3,53 @@
 from __future__ import annotations
 
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
 
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
 
-def configure_logging(debug: bool) -> None:
-    """Configure application logging level and format."""
 
-    logging.basicConfig(
-        level=logging.DEBUG if debug else logging.INFO,
-        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
-    )
+def configure_logging(debug: bool) -> QueueListener:
+    """Configure application logging level and format.
+
+    Records are handed to a ``QueueHandler`` on the root logger and written by
+    a ``QueueListener`` thread, so request handlers never block on stream I/O.
+    The caller owns the returned listener and must pass it to ``stop_logging``
+    on shutdown.
+    """
+
+    root = logging.getLogger()
+    root.setLevel(logging.DEBUG if debug else logging.INFO)
+
+    # Reuse handlers configured elsewhere (matching basicConfig semantics) but
+    # drop queue handlers left behind by a previous startup in this process.
+    handlers = [h for h in root.handlers if not isinstance(h, QueueHandler)]
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    if not handlers:
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        handlers = [stream_handler]
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    root.addHandler(QueueHandler(log_queue))
+    listener.start()
+    return listener
+
+
+def stop_logging(listener: QueueListener) -> None:
+    """Undo ``configure_logging``: log directly again and stop the listener.
+
+    The root logger gets the listener's handlers back before the queue is
+    drained, so records logged after shutdown are still written instead of
+    piling up in a queue nobody reads.
+    """
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, QueueHandler) and handler.queue is listener.queue:
+            root.removeHandler(handler)
+    for handler in listener.handlers:
+        root.addHandler(handler)
+    listener.stop()
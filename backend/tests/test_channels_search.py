@@ -0,0 +1,145 @@
+"""Check /channels filtering and paging against a naive linear filter.
+
+Run from the repository root with ``python -m unittest discover backend/tests``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+import tempfile
+import unittest
+
+import orjson
+
+from backend.app.config import get_settings
+from backend.app.routes import channels as channel_routes
+from backend.app.services import cache
+
+GROUPS = [
+    "News HD",
+    "Movies VOD",
+    "Series: Drama",
+    "Sports Live",
+    "Kids",
+    "Random Stuff",
+    " Weird ",
+    "Cinema FR",
+    "Shows UK",
+]
+WORDS = ["UFC", "paramount", "Ok", "Été", "a", "ab", "xyz", "Chan"]
+
+_TMP: tempfile.TemporaryDirectory | None = None
+_SAVED_ENV: str | None = None
+
+
+def setUpModule() -> None:
+    global _TMP, _SAVED_ENV
+    _TMP = tempfile.TemporaryDirectory()
+    _SAVED_ENV = os.environ.get("CACHE_DIR")
+    os.environ["CACHE_DIR"] = _TMP.name
+    get_settings.cache_clear()
+    cache.invalidate_memory_cache()
+
+    rng = random.Random(7)
+    playlist = [
+        {
+            "name": f"{rng.choice(WORDS)} {i} {rng.choice(WORDS)}",
+            "url": f"http://stream/{i}.ts",
+            "group": rng.choice(GROUPS),
+        }
+        for i in range(2000)
+    ]
+    cache.save_cache("host.example", playlist)
+
+
+def tearDownModule() -> None:
+    if _SAVED_ENV is None:
+        os.environ.pop("CACHE_DIR", None)
+    else:
+        os.environ["CACHE_DIR"] = _SAVED_ENV
+    get_settings.cache_clear()
+    cache.invalidate_memory_cache()
+    if _TMP is not None:
+        _TMP.cleanup()
+
+
+def _get_channels(**params: object) -> dict:
+    params.setdefault("page", 1)
+    params.setdefault("page_size", 50)
+    params.setdefault("search", None)
+    params.setdefault("category", None)
+    params.setdefault("group", None)
+    params.setdefault("include_total", True)
+    response = asyncio.run(channel_routes.get_channels(**params))
+    return orjson.loads(response.body)
+
+
+def _naive(search: str | None, category: str | None, group: str | None) -> list[dict]:
+    matched = []
+    for ch in cache.load_cache()["channels"]:
+        if search and search.lower() not in ch["name"].lower():
+            continue
+        if category and ch["category"] != category.lower():
+            continue
+        if group and group.lower() not in ch["group"].lower():
+            continue
+        matched.append(ch)
+    return matched
+
+
+class ChannelSearchTest(unittest.TestCase):
+    def setUp(self) -> None:
+        # Every case starts from a fresh load so the lazily built search
+        # structures are exercised from scratch as well as warm.
+        cache.invalidate_memory_cache()
+
+    def assert_matches_naive(self, **params: object) -> None:
+        body = _get_channels(**params)
+        expected = _naive(params.get("search"), params.get("category"), params.get("group"))
+        page = int(params.get("page", 1))
+        page_size = int(params.get("page_size", 50))
+        offset = (page - 1) * page_size
+        self.assertEqual(body["total"], len(expected), params)
+        self.assertEqual(
+            [ch["url"] for ch in body["channels"]],
+            [ch["url"] for ch in expected[offset : offset + page_size]],
+            params,
+        )
+
+    def test_searches_of_each_length(self) -> None:
+        for search in ["a", "É", "\n", "ab", "Ok", "UFC", "été", "chan 1", "xyz 19", "zzz"]:
+            for page in (1, 3):
+                with self.subTest(search=search, page=page):
+                    self.assert_matches_naive(search=search, page=page)
+
+    def test_search_combined_with_filters(self) -> None:
+        cases = [
+            {"search": "a", "category": "movies"},
+            {"search": "ok", "group": "news"},
+            {"search": "para", "category": "TV", "group": "s"},
+            {"search": "1", "group": "weird", "page": 2, "page_size": 7},
+            {"search": "chan", "category": "series", "page": 4, "page_size": 10},
+        ]
+        for params in cases:
+            with self.subTest(**params):
+                self.assert_matches_naive(**params)
+
+    def test_filters_without_search(self) -> None:
+        for params in ({"category": "movies"}, {"group": "e", "page": 5}, {}):
+            with self.subTest(**params):
+                self.assert_matches_naive(**params)
+
+    def test_partial_total_returns_same_page(self) -> None:
+        body = _get_channels(search="ab", page=2, page_size=20, include_total=False)
+        expected = _naive("ab", None, None)
+        self.assertEqual(
+            [ch["url"] for ch in body["channels"]],
+            [ch["url"] for ch in expected[20:40]],
+        )
+        self.assertLessEqual(body["total"], len(expected))
+
+
+if __name__ == "__main__":
+    unittest.main()